@@ -7,28 +7,114 @@ _parse_hex_value is used to parse unknown params in different formats.
 Just run it from the terminal as python3 2411_parser.py
 """
 
+from __future__ import annotations
+
 import logging
+from collections import namedtuple
+from types import MappingProxyType
 from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class MockMessage:
+    """A minimal stand-in for a Message, carrying only the verb."""
+
+    __slots__ = ("verb",)
+
+    def __init__(self, verb: str) -> None:
+        self.verb = verb
+
+
+# One immutable sentinel per verb, reused across decodes (the class body and
+# __init__ are not re-executed per message)
+_MOCK_MSGS: dict[str, MockMessage] = {}
+
+
+def _decode_hex(payload: str) -> bytes:
+    """Decode a hex-encoded ASCII payload to its raw bytes, once per message.
+
+    All downstream block parsers index this buffer directly (via
+    `int.from_bytes`), rather than re-slicing the `str` and paying an
+    `int(x, 16)` parse per field.
+
+    :param payload: Hex string payload
+    :return: Decoded byte buffer
+    :raises ValueError: If the payload is not valid (even-length) hex
+    """
+    return bytes.fromhex(payload)
+
+
+# Field decoder expressions, indexed by the decoder_id column of a "fields"
+# table; {s}/{e} are filled with the [start:end) byte offsets at codegen time
+
+_FIELD_EXPRS = (
+    "buf[{s}:{e}].hex().upper()",  # D_RAW
+    'buf[{s}:{e}] == b"\\x01"',  # D_EQ01
+    "buf[{s}]",  # D_U8
+    'int.from_bytes(buf[{s}:{e}], "big")',  # D_U16_BE
+)
+D_RAW, D_EQ01, D_U8, D_U16_BE = range(len(_FIELD_EXPRS))
+
+
+def _compile_param_parser(
+    param_id: str, fields: tuple[tuple[str, int, int | None, int], ...]
+) -> Any:
+    """Generate a specialized parser for one param's field table.
+
+    The emitted function has the slice offsets baked in as literals - no
+    per-field table walk or decoder dispatch at parse time - and returns a
+    per-param namedtuple (a C struct, no dict allocation or key hashing);
+    callers serialize via ._asdict() only at the dict boundary.
+
+    :param param_id: Hex parameter ID (used to name the generated function)
+    :param fields: The (field_name, start, end, decoder_id) records
+    :return: A callable mapping decoded payload bytes to a named tuple
+    """
+    items = ", ".join(
+        _FIELD_EXPRS[did].format(s=start, e=end) for _, start, end, did in fields
+    )
+    source = f"def _parse_{param_id}(buf):\n    return _NT({items})\n"
+    namespace: dict[str, Any] = {
+        "_NT": namedtuple(f"Param_{param_id}", [name for name, *_ in fields])  # type: ignore[misc]
+    }
+    exec(compile(source, f"<2411:{param_id}>", "exec"), namespace)  # noqa: S102
+    return namespace[f"_parse_{param_id}"]
+
+
 # Parameter definitions
 # Add parameters that we know how to parse (or parts of it)
+# Each "fields" entry is a (field_name, start, end, decoder_id) record, with
+# start/end as byte offsets into the decoded payload (end=None meaning to the
+# end of the buffer); one loop over the table materializes the result dict
 
 Known_2411_PARAMS: dict[str, Any] = {
     # TODO: add params that were decoded.
     #     "000007": {
     #         "name": "base_vent_enabled",
     #         "description": "Base Ventilation Enable/Disable",
-    #         "parser": lambda payload, offset: {
-    #             "unknown1": payload[6:16],
-    #             "enabled": payload[16:18] == "01",
-    #             "unknown2": payload[18:],
-    #         },
+    #         "fields": (
+    #             ("unknown1", 3, 8, D_RAW),
+    #             ("enabled", 8, 9, D_EQ01),
+    #             ("unknown2", 9, None, D_RAW),
+    #         ),
     #     },
 }
 
+# Derived, frozen dispatch table keyed by the unhexed 3-byte param code, so
+# lookups hash 3 bytes rather than a 6-char str (and authors keep editing the
+# readable hex-keyed table above)
+_PARAMS_BY_BYTES: MappingProxyType[bytes, dict[str, Any]] = MappingProxyType(
+    {bytes.fromhex(k): v for k, v in Known_2411_PARAMS.items()}
+)
+
+# Specialized (codegen'd) parsers, one per known param with a "fields" table
+_SPECIALIZED: dict[bytes, Any] = {
+    bytes.fromhex(k): _compile_param_parser(k, v["fields"])
+    for k, v in Known_2411_PARAMS.items()
+    if "fields" in v
+}
+
 
 def parser_2411(payload: str, msg: Any) -> dict[str, Any]:
     """
@@ -49,11 +135,12 @@ def parser_2411(payload: str, msg: Any) -> dict[str, Any]:
         "parameter_hex": f"0x{param_id}",
     }
 
-    # Get parameter definition
-    param_def_raw = Known_2411_PARAMS.get(param_id)
-    param_def: dict[str, Any] | None = (
-        param_def_raw if isinstance(param_def_raw, dict) else None
-    )
+    # Get parameter definition (keyed by the unhexed 3-byte param code)
+    try:
+        param_code = bytes.fromhex(param_id)
+    except ValueError:
+        param_code = b""
+    param_def: dict[str, Any] | None = _PARAMS_BY_BYTES.get(param_code)
 
     if param_def:
         result["parameter_name"] = param_def["name"]
@@ -68,15 +155,14 @@ def parser_2411(payload: str, msg: Any) -> dict[str, Any]:
         return result
 
     try:
-        if param_def and "parser" in param_def:
-            # Use the custom parser function from the parameter definition
-            parser_func = param_def["parser"]
-            offset = param_def.get("offset", 0)
-            parsed_data = parser_func(payload, offset)
-            result.update(parsed_data)
+        buf = _decode_hex(payload)
+
+        if (parse_fields := _SPECIALIZED.get(param_code)) is not None:
+            # Specialized parser with this param's offsets/keys baked in
+            result.update(parse_fields(buf)._asdict())
         else:
             # Unknown parameter - try different parsing strategies
-            result.update(_parse_unknown_parameter(payload, param_id))
+            result.update(_parse_unknown_parameter(buf, param_id))
 
         # Extract footer/status bytes (last 6 bytes typically)
         if len(payload) >= 46:
@@ -91,82 +177,69 @@ def parser_2411(payload: str, msg: Any) -> dict[str, Any]:
     return result
 
 
-def _parse_unknown_parameter(payload: str, param_id: str) -> dict[str, Any]:
+def _parse_unknown_parameter(buf: bytes, param_id: str) -> dict[str, Any]:
     """
     Try different parsing strategies for unknown 2411 parameters.
 
-    :param payload: Hex string payload
+    :param buf: Decoded payload bytes (see `_decode_hex`)
     :param param_id: Parameter ID
     :return: Dictionary with parsed data from different strategies
     """
     result = {}
 
     # Strategy 1: Try 4-byte blocks from position 6 onwards
-    result["strategy_4byte"] = _try_4byte_blocks(payload)
+    result["strategy_4byte"] = _try_4byte_blocks(buf)
 
     # Strategy 2: Try 6-byte blocks from position 6 onwards
-    result["strategy_6byte"] = _try_6byte_blocks(payload)
+    result["strategy_6byte"] = _try_6byte_blocks(buf)
 
     # Strategy 3: Try 8-byte blocks from position 6 onwards
-    result["strategy_8byte"] = _try_8byte_blocks(payload)
+    result["strategy_8byte"] = _try_8byte_blocks(buf)
 
     return result
 
 
-def _parse_hex_value(hex_str: str) -> dict[str, Any]:
+def _parse_hex_value(block: bytes) -> dict[str, Any]:
     """
-    Parse a hex string into multiple useful representations.
+    Parse a block of payload bytes into multiple useful representations.
 
-    :param hex_str: Hex string to parse
+    :param block: Bytes to parse (a slice of the decoded payload)
     :return: Dictionary with parsed representations
     """
-    result: dict[str, Any] = {"raw": hex_str, "hex": f"0x{hex_str.upper()}"}
+    raw = block.hex().upper()
+    result: dict[str, Any] = {"raw": raw, "hex": f"0x{raw}"}
 
-    try:
-        # Basic decimal value
-        dec = int(hex_str, 16)
-        result["dec"] = dec
-
-        # Byte-swapped version (big-endian to little-endian)
-        if len(hex_str) % 2 == 0:  # Only if even number of hex digits
-            # Swap byte order (e.g., "A1B2" -> "B2A1")
-            swapped = "".join(
-                reversed([hex_str[i : i + 2] for i in range(0, len(hex_str), 2)])
-            )
-            result["swapped_hex"] = f"0x{swapped.upper()}"
-            result["swapped_dec"] = int(swapped, 16)
-
-            # Little-endian interpretation
-            le_bytes = bytes.fromhex(hex_str)
-            le_value = int.from_bytes(le_bytes, byteorder="little", signed=False)
-            result["le_dec"] = le_value
-            result["le_hex"] = f"0x{le_value:X}"
-
-            # Signed integer interpretation
-            if len(hex_str) in [4, 8]:  # 16-bit or 32-bit
-                result["signed_dec"] = int.from_bytes(
-                    le_bytes, byteorder="big", signed=True
-                )
-
-        # Binary representation
-        result["bin"] = f"0b{dec:0{len(hex_str) * 4}b}"
-
-        # ASCII interpretation if possible (for 2 or 4 character hex)
-        if len(hex_str) in [2, 4, 6, 8]:
-            try:
-                ascii_str = bytes.fromhex(hex_str).decode("ascii", errors="replace")
-                if all(32 <= ord(c) <= 126 for c in ascii_str):
-                    result["ascii"] = ascii_str
-            except (UnicodeDecodeError, ValueError):
-                pass
-
-    except ValueError as e:
-        result["error"] = str(e)
+    # Basic decimal value (big-endian, as the hex string reads)
+    dec = int.from_bytes(block, byteorder="big", signed=False)
+    result["dec"] = dec
+
+    # Byte-swapped version (big-endian to little-endian)
+    # Swap byte order (e.g., "A1B2" -> "B2A1")
+    result["swapped_hex"] = f"0x{block[::-1].hex().upper()}"
+    result["swapped_dec"] = int.from_bytes(block, byteorder="little", signed=False)
+
+    # Little-endian interpretation
+    le_value = int.from_bytes(block, byteorder="little", signed=False)
+    result["le_dec"] = le_value
+    result["le_hex"] = f"0x{le_value:X}"
+
+    # Signed integer interpretation
+    if len(block) in [2, 4]:  # 16-bit or 32-bit
+        result["signed_dec"] = int.from_bytes(block, byteorder="big", signed=True)
+
+    # Binary representation
+    result["bin"] = f"0b{dec:0{len(block) * 8}b}"
+
+    # ASCII interpretation if possible (for 1- to 4-byte blocks)
+    if len(block) in [1, 2, 3, 4]:
+        ascii_str = block.decode("ascii", errors="replace")
+        if all(32 <= ord(c) <= 126 for c in ascii_str):
+            result["ascii"] = ascii_str
 
     return result
 
 
-def _try_4byte_blocks(payload: str) -> dict[str, Any]:
+def _try_4byte_blocks(buf: bytes) -> dict[str, Any]:
     """
     Try parsing as 4-byte (8 hex character) blocks.
 
@@ -183,23 +256,23 @@ def _try_4byte_blocks(payload: str) -> dict[str, Any]:
     - ascii: ASCII interpretation (if possible)
     - offset: Position in the original payload
 
-    :param payload: Hex string payload
+    :param buf: Decoded payload bytes
     :return: Dictionary with parsed 4-byte blocks
     """
     blocks = {}
-    data_section = payload[6:]  # Skip parameter ID
+    data_section = buf[3:]  # Skip parameter ID
 
-    for i in range(0, min(len(data_section), 32), 4):  # Up to 8 blocks
-        if i + 4 <= len(data_section):
-            block = data_section[i : i + 4]
+    for i in range(0, min(len(data_section), 16), 2):  # Up to 8 blocks
+        if i + 2 <= len(data_section):
+            block = data_section[i : i + 2]
             block_info = _parse_hex_value(block)
-            block_info["offset"] = 6 + i  # Add offset to the original payload
-            blocks[f"block_{i // 4 + 1}"] = block_info
+            block_info["offset"] = 6 + i * 2  # Offset into the original hex payload
+            blocks[f"block_{i // 2 + 1}"] = block_info
 
     return blocks
 
 
-def _try_6byte_blocks(payload: str) -> dict[str, Any]:
+def _try_6byte_blocks(buf: bytes) -> dict[str, Any]:
     """
     Try parsing as 6-byte (12 hex character) blocks.
 
@@ -216,23 +289,23 @@ def _try_6byte_blocks(payload: str) -> dict[str, Any]:
     - ascii: ASCII interpretation (if possible)
     - offset: Position in the original payload
 
-    :param payload: Hex string payload
+    :param buf: Decoded payload bytes
     :return: Dictionary with parsed 6-byte blocks
     """
     blocks = {}
-    data_section = payload[6:]  # Skip parameter ID
+    data_section = buf[3:]  # Skip parameter ID
 
-    for i in range(0, min(len(data_section), 30), 6):  # Up to 5 blocks
-        if i + 6 <= len(data_section):
-            block = data_section[i : i + 6]
+    for i in range(0, min(len(data_section), 15), 3):  # Up to 5 blocks
+        if i + 3 <= len(data_section):
+            block = data_section[i : i + 3]
             block_info = _parse_hex_value(block)
-            block_info["offset"] = 6 + i
-            blocks[f"block_{i // 6 + 1}"] = block_info
+            block_info["offset"] = 6 + i * 2
+            blocks[f"block_{i // 3 + 1}"] = block_info
 
     return blocks
 
 
-def _try_8byte_blocks(payload: str) -> dict[str, Any]:
+def _try_8byte_blocks(buf: bytes) -> dict[str, Any]:
     """
     Try parsing as 8-byte (16 hex character) blocks.
 
@@ -249,18 +322,18 @@ def _try_8byte_blocks(payload: str) -> dict[str, Any]:
     - ascii: ASCII interpretation (if possible)
     - offset: Position in the original payload
 
-    :param payload: Hex string payload
+    :param buf: Decoded payload bytes
     :return: Dictionary with parsed 8-byte blocks
     """
     blocks = {}
-    data_section = payload[6:]  # Skip parameter ID
+    data_section = buf[3:]  # Skip parameter ID
 
-    for i in range(0, min(len(data_section), 32), 8):  # Up to 4 blocks
-        if i + 8 <= len(data_section):
-            block = data_section[i : i + 8]
+    for i in range(0, min(len(data_section), 16), 4):  # Up to 4 blocks
+        if i + 4 <= len(data_section):
+            block = data_section[i : i + 4]
             block_info = _parse_hex_value(block)
-            block_info["offset"] = 6 + i
-            blocks[f"block_{i // 8 + 1}"] = block_info
+            block_info["offset"] = 6 + i * 2
+            blocks[f"block_{i // 4 + 1}"] = block_info
 
     return blocks
 
@@ -460,11 +533,8 @@ def decode_2411_message(raw_message: str, verb: str = "RP") -> dict[str, Any]:
     :return: Decoded message dictionary
     """
 
-    class MockMessage:
-        def __init__(self, verb: str) -> None:
-            self.verb = verb
-
-    result = parser_2411(raw_message, MockMessage(verb))
+    msg = _MOCK_MSGS.get(verb) or _MOCK_MSGS.setdefault(verb, MockMessage(verb))
+    result = parser_2411(raw_message, msg)
     result["verb"] = verb  # Add verb to result for display
     return result
 
@@ -3,8 +3,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import timedelta as td
-from enum import IntEnum
+from enum import IntFlag
+from types import MappingProxyType
 from typing import Final
 
 from ramses_tx.const import (
@@ -39,6 +41,205 @@ from ramses_tx.const import (
 
 from .enums import DevRole as DevRole, DevType as DevType, ZoneRole as ZoneRole
 
+# Everything this module re-exports or defines for downstream consumers
+__all__ = [
+    "AttrDict",
+    "Code",
+    "DEFAULT_MAX_ZONES",
+    "DEVICE_ID_REGEX",
+    "DEV_MODE",
+    "DEV_ROLE_MAP",
+    "DEV_TYPE_MAP",
+    "DOMAIN_TYPE_MAP",
+    "DONT_CREATE_ENTITIES",
+    "DONT_CREATE_MESSAGES",
+    "DONT_UPDATE_ENTITIES",
+    "DevRole",
+    "DevType",
+    "Discover",
+    "F9",
+    "FA",
+    "FAN_MODE",
+    "FAULT_DEVICE_CLASS",
+    "FAULT_STATE",
+    "FAULT_TYPE",
+    "FC",
+    "FF",
+    "FaultDeviceClass",
+    "FaultState",
+    "FaultType",
+    "GATEWAY_MESSAGE_TIMEOUT",
+    "HEARTBEAT_TIMEOUT_DEFAULT",
+    "HEARTBEAT_TIMEOUT_FILTER",
+    "HEARTBEAT_TIMEOUT_OTB",
+    "HEARTBEAT_TIMEOUT_REMOTE",
+    "HEARTBEAT_TIMEOUT_SENSOR",
+    "HEARTBEAT_TIMEOUT_TRV",
+    "HIGH_VOLUME_STATUS_CODES",
+    "I_",
+    "IndexT",
+    "LOOKUP_PUZZ",
+    "RP",
+    "RQ",
+    "SCHED_REFRESH_INTERVAL",
+    "SYS_MODE_MAP",
+    "SZ_ACCEPT",
+    "SZ_ACTIVE",
+    "SZ_ACTUATOR",
+    "SZ_ACTUATORS",
+    "SZ_ACTUATOR_COUNTDOWN",
+    "SZ_ACTUATOR_ENABLED",
+    "SZ_AIR_QUALITY",
+    "SZ_AIR_QUALITY_BASIS",
+    "SZ_BATTERY_LEVEL",
+    "SZ_BATTERY_LOW",
+    "SZ_BATTERY_STATE",
+    "SZ_BINDINGS",
+    "SZ_BOILER_OUTPUT_TEMP",
+    "SZ_BOILER_RETURN_TEMP",
+    "SZ_BOILER_SETPOINT",
+    "SZ_BOOST_TIMER",
+    "SZ_BURNER_FAILED_STARTS",
+    "SZ_BURNER_HOURS",
+    "SZ_BURNER_STARTS",
+    "SZ_BYPASS_MODE",
+    "SZ_BYPASS_POSITION",
+    "SZ_BYPASS_STATE",
+    "SZ_CHANGE_COUNTER",
+    "SZ_CH_ACTIVE",
+    "SZ_CH_ENABLED",
+    "SZ_CH_MAX_SETPOINT",
+    "SZ_CH_PUMP_HOURS",
+    "SZ_CH_PUMP_STARTS",
+    "SZ_CH_SETPOINT",
+    "SZ_CH_WATER_PRESSURE",
+    "SZ_CO2_LEVEL",
+    "SZ_CONFIG",
+    "SZ_CONFIRM",
+    "SZ_COOLING_ACTIVE",
+    "SZ_COOLING_ENABLED",
+    "SZ_COOL_ACTIVE",
+    "SZ_CYCLE_COUNTDOWN",
+    "SZ_DATETIME",
+    "SZ_DEMAND",
+    "SZ_DEVICES",
+    "SZ_DEVICE_CLASS",
+    "SZ_DEVICE_ID",
+    "SZ_DEVICE_ROLE",
+    "SZ_DEWPOINT_TEMP",
+    "SZ_DHW_ACTIVE",
+    "SZ_DHW_BLOCKING",
+    "SZ_DHW_BURNER_HOURS",
+    "SZ_DHW_BURNER_STARTS",
+    "SZ_DHW_ENABLED",
+    "SZ_DHW_FLOW_RATE",
+    "SZ_DHW_IDX",
+    "SZ_DHW_PUMP_HOURS",
+    "SZ_DHW_PUMP_STARTS",
+    "SZ_DHW_SETPOINT",
+    "SZ_DHW_TEMP",
+    "SZ_DIFFERENTIAL",
+    "SZ_DISABLE_DISCOVERY",
+    "SZ_DISABLE_POLLING",
+    "SZ_DOMAIN_ID",
+    "SZ_DOMAIN_IDX",
+    "SZ_DURATION",
+    "SZ_EXHAUST_FAN_SPEED",
+    "SZ_EXHAUST_FLOW",
+    "SZ_EXHAUST_TEMP",
+    "SZ_FAN_INFO",
+    "SZ_FAN_MODE",
+    "SZ_FAN_RATE",
+    "SZ_FAULT_PRESENT",
+    "SZ_FAULT_STATE",
+    "SZ_FAULT_TYPE",
+    "SZ_FILTER_DIRTY",
+    "SZ_FILTER_REMAINING",
+    "SZ_FILTER_REMAINING_PERCENT",
+    "SZ_FLAME_ACTIVE",
+    "SZ_FLAME_ON",
+    "SZ_FLAME_SIGNAL_LOW",
+    "SZ_FRAGMENT",
+    "SZ_FRAG_LENGTH",
+    "SZ_FRAG_NUMBER",
+    "SZ_FROST_CYCLE",
+    "SZ_HAS_FAULT",
+    "SZ_HEAT_DEMAND",
+    "SZ_INDOOR_HUMIDITY",
+    "SZ_INDOOR_TEMP",
+    "SZ_IS_BATTERY",
+    "SZ_IS_DST",
+    "SZ_LANGUAGE",
+    "SZ_LOCAL_OVERRIDE",
+    "SZ_LOG_ENTRY",
+    "SZ_LOG_IDX",
+    "SZ_MAX_REL_MODULATION",
+    "SZ_MAX_TEMP",
+    "SZ_MINUTES",
+    "SZ_MIN_TEMP",
+    "SZ_MODE",
+    "SZ_MODULATION_LEVEL",
+    "SZ_MULTIROOM_MODE",
+    "SZ_NAME",
+    "SZ_OEM_CODE",
+    "SZ_OFFER",
+    "SZ_OPENWINDOW_FUNCTION",
+    "SZ_OTC_ACTIVE",
+    "SZ_OUTDOOR_HUMIDITY",
+    "SZ_OUTDOOR_TEMP",
+    "SZ_OUTSIDE_TEMP",
+    "SZ_OVERRUN",
+    "SZ_PAYLOAD",
+    "SZ_PHASE",
+    "SZ_POLLING_INTERVAL",
+    "SZ_POST_HEAT",
+    "SZ_PRESENCE_DETECTED",
+    "SZ_PRESSURE",
+    "SZ_PRE_HEAT",
+    "SZ_RELAY_DEMAND",
+    "SZ_RELAY_FAILSAFE",
+    "SZ_REL_HUMIDITY",
+    "SZ_REL_MODULATION_LEVEL",
+    "SZ_REMAINING_DAYS",
+    "SZ_REMAINING_MINS",
+    "SZ_REMAINING_PERCENT",
+    "SZ_REQ_REASON",
+    "SZ_REQ_SPEED",
+    "SZ_SCHEDULE",
+    "SZ_SENSOR",
+    "SZ_SENSOR_FAULT",
+    "SZ_SETPOINT",
+    "SZ_SETPOINT_BOUNDS",
+    "SZ_SPEED_CAPABILITIES",
+    "SZ_SUMMER_MODE",
+    "SZ_SUPPLY_FAN_SPEED",
+    "SZ_SUPPLY_FLOW",
+    "SZ_SUPPLY_TEMP",
+    "SZ_SYSTEM_MODE",
+    "SZ_TEMPERATURE",
+    "SZ_TIMESTAMP",
+    "SZ_TOTAL_FRAGS",
+    "SZ_UFH_IDX",
+    "SZ_UNKNOWN",
+    "SZ_UNTIL",
+    "SZ_VALUE",
+    "SZ_WINDOW_OPEN",
+    "SZ_ZONES",
+    "SZ_ZONE_CLASS",
+    "SZ_ZONE_IDX",
+    "SZ_ZONE_MASK",
+    "SZ_ZONE_TYPE",
+    "SystemType",
+    "VerbT",
+    "WB_STATUS_CODES",
+    "W_",
+    "ZON_MODE_MAP",
+    "ZON_ROLE_MAP",
+    "ZoneRole",
+    "__dev_mode__",
+    "attr_dict_factory",
+]
+
 SZ_ACTIVE: Final = "active"
 SZ_ACTUATOR: Final = "actuator"
 SZ_ACTUATOR_ENABLED: Final = "actuator_enabled"
@@ -208,7 +409,7 @@ SZ_COOL_ACTIVE: Final = "cool_active"
 SZ_CYCLE_COUNTDOWN: Final = "cycle_countdown"
 
 
-class Discover(IntEnum):
+class Discover(IntFlag):
     """Flags for the discovery process."""
 
     NOTHING = 0
@@ -218,7 +419,7 @@ class Discover(IntEnum):
     FAULTS = 8
     SCHEDS = 16
     TRAITS = 32
-    DEFAULT = 1 + 2 + 4
+    DEFAULT = SCHEMA | PARAMS | STATUS
 
 
 DONT_CREATE_MESSAGES: Final[int] = 3
@@ -249,43 +450,48 @@ HIGH_VOLUME_STATUS_CODES: Final = (
 )
 
 # Status codes for Worcester Bosch boilers - OT|OEM diagnostic code
-WB_STATUS_CODES: Final[dict[str, str]] = {
-    "200": "CH system is being heated.",
-    "201": "DHW system is being heated.",
-    "202": (
-        "Anti rapid cycle mode. The boiler has commenced anti-cycle period for CH."
-    ),
-    "203": "System standby mode.",
-    "204": "System waiting, appliance waiting for heating system to cool.",
-    "208": "Appliance in service Test mode (Min/Max)",
-    "265": (
-        "EMS controller has forced stand-by-mode due to low heating "
-        "load (power required is less than the minimum output)"
-    ),
-    "268": (
-        "Component test mode (is running the manual component test as "
-        "activated in the menus)."
-    ),
-    "270": "Power up mode (appliance is powering up).",
-    "283": "Burner starting. The fan and the pump are being controlled.",
-    "284": (
-        "Gas valve(s) opened, flame must be detected within safety "
-        "time. The gas valve is being controlled."
-    ),
-    "305": (
-        "Anti fast cycle mode (DHW keep warm function). Diverter valve "
-        "is held in DHW position for a period of time after DHW demand."
-    ),
-    "357": (
-        "Appliance in air purge mode. Primary heat exchanger air "
-        "venting program active - approximately 100 seconds."
-    ),
-    "358": (
-        "Three way valve kick. If the 3-way valve hasn't moved in "
-        "within 48 hours, the valve will operate once to prevent "
-        "seizure"
-    ),
-}
+# Keyed by the (small) integer code as decoded from the wire, so lookups are
+# an int hash with no str formatting at the call site; frozen as it is a
+# reference table
+WB_STATUS_CODES: Final[Mapping[int, str]] = MappingProxyType(
+    {
+        200: "CH system is being heated.",
+        201: "DHW system is being heated.",
+        202: (
+            "Anti rapid cycle mode. The boiler has commenced anti-cycle period for CH."
+        ),
+        203: "System standby mode.",
+        204: "System waiting, appliance waiting for heating system to cool.",
+        208: "Appliance in service Test mode (Min/Max)",
+        265: (
+            "EMS controller has forced stand-by-mode due to low heating "
+            "load (power required is less than the minimum output)"
+        ),
+        268: (
+            "Component test mode (is running the manual component test as "
+            "activated in the menus)."
+        ),
+        270: "Power up mode (appliance is powering up).",
+        283: "Burner starting. The fan and the pump are being controlled.",
+        284: (
+            "Gas valve(s) opened, flame must be detected within safety "
+            "time. The gas valve is being controlled."
+        ),
+        305: (
+            "Anti fast cycle mode (DHW keep warm function). Diverter valve "
+            "is held in DHW position for a period of time after DHW demand."
+        ),
+        357: (
+            "Appliance in air purge mode. Primary heat exchanger air "
+            "venting program active - approximately 100 seconds."
+        ),
+        358: (
+            "Three way valve kick. If the 3-way valve hasn't moved in "
+            "within 48 hours, the valve will operate once to prevent "
+            "seizure"
+        ),
+    }
+)
 
 # Device Availability Timeouts
 HEARTBEAT_TIMEOUT_DEFAULT = td(hours=1)
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from inspect import getmembers, isclass
+from inspect import isclass
 from sys import modules
 from typing import TYPE_CHECKING, Any
 
@@ -50,10 +50,11 @@ def class_by_attr(name: str, attr: str) -> dict[str, Any]:
     :rtype: dict[str, Any]
     """
 
-    def predicate(m: Any) -> bool:
-        return isclass(m) and m.__module__ == name and bool(getattr(m, attr, None))
-
-    return {getattr(c[1], attr): c[1] for c in getmembers(modules[name], predicate)}
+    return {
+        val: m
+        for m in vars(modules[name]).values()
+        if isclass(m) and m.__module__ == name and (val := getattr(m, attr, None))
+    }
 
 
 class _Entity:
@@ -7,6 +7,7 @@ import logging
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime as dt
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar
 
 from ramses_rf.address import Address, id_to_address
@@ -62,6 +63,30 @@ PayloadT: TypeAlias = Any
 _MessageT = TypeVar("_MessageT", bound="Message")
 
 
+def _index_list_payload(
+    payload: list[dict[str, Any]], key: str
+) -> dict[Any, dict[str, Any]]:
+    """Index a list payload's sub-payloads by the given key.
+
+    Entries sharing a key value are merged (later entries win), matching the
+    flattening previously done per read by the state accessors.
+
+    :param payload: The list-of-dicts payload to index.
+    :type payload: list[dict[str, Any]]
+    :param key: The index key (e.g. zone_idx, domain_id).
+    :type key: str
+    :return: A mapping of key value to sub-payload.
+    :rtype: dict[Any, dict[str, Any]]
+    """
+    index: dict[Any, dict[str, Any]] = {}
+    for d in payload:
+        if not isinstance(d, dict) or (val := d.get(key)) is None:
+            continue
+        prev = index.get(val)
+        index[val] = {**prev, **d} if prev else d
+    return index
+
+
 class Message:
     """The Message class; will trap/log invalid msgs."""
 
@@ -123,9 +148,9 @@ class Message:
 
         self._payload = self._validate(dto.payload)
 
-    @property
+    @cached_property
     def context(self) -> RoutingContext:
-        """Calculate the sub-payload context natively.
+        """Calculate the sub-payload context natively (cached, immutable).
 
         :return: The context value.
         :rtype: RoutingContext
@@ -136,9 +161,9 @@ class Message:
             return RoutingContext(payload[4:6])
         return RoutingContext(getattr(self, "_idx_val", None))
 
-    @property
+    @cached_property
     def state_header(self) -> StateHeader:
-        """Calculate the state routing header natively.
+        """Calculate the state routing header natively (cached, immutable).
 
         :return: The state header instance.
         :rtype: StateHeader
@@ -150,6 +175,30 @@ class Message:
             context_val=self.context.value,
         )
 
+    @cached_property
+    def _payload_by_zone_idx(self) -> dict[Any, dict[str, Any]]:
+        """Index a list payload's entries by zone_idx (cached, immutable).
+
+        :return: A mapping of zone_idx to sub-payload; empty if not a list.
+        :rtype: dict[Any, dict[str, Any]]
+        """
+        payload = self._payload
+        if not isinstance(payload, list):
+            return {}
+        return _index_list_payload(payload, SZ_ZONE_IDX)
+
+    @cached_property
+    def _payload_by_domain_id(self) -> dict[Any, dict[str, Any]]:
+        """Index a list payload's entries by domain_id (cached, immutable).
+
+        :return: A mapping of domain_id to sub-payload; empty if not a list.
+        :rtype: dict[Any, dict[str, Any]]
+        """
+        payload = self._payload
+        if not isinstance(payload, list):
+            return {}
+        return _index_list_payload(payload, SZ_DOMAIN_ID)
+
     def _format_frame(self, seqn: str | None = None) -> str:
         """Format the message into a standard ASCII RAMSES RF packet frame.
 
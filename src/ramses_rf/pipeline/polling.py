@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import heapq
 import logging
 from dataclasses import dataclass
 from datetime import UTC, datetime as dt, timedelta as td
@@ -20,6 +21,7 @@ from ramses_rf.helpers import schedule_task
 from ramses_rf.typing import DeviceIdT, PollingIntervalsT
 
 if TYPE_CHECKING:
+    from ramses_rf.config import GatewayConfig
     from ramses_rf.devices.dev_base import DeviceBase
     from ramses_rf.gateway import Gateway
 
@@ -94,7 +96,7 @@ def _ensure_aware(dtm: dt) -> dt:
     return dtm
 
 
-@dataclass
+@dataclass(slots=True)
 class PollingTask:
     """Represents a scheduled polling task for a device command.
 
@@ -145,10 +147,15 @@ class PollingManager:
         :type cycle_interval: float
         """
         self._gwy = gwy
+        # The config object is stable for the gateway's lifetime; cache it so
+        # the per-cycle guards don't re-walk the gwy attribute chain
+        self._config: GatewayConfig = gwy.config
         self.shadow_mode: bool = shadow_mode
         self._cycle_interval: float = cycle_interval
 
         self._tasks: dict[tuple[DeviceIdT, str], PollingTask] = {}
+        # Min-heap of (next_due, task key) with lazy deletion of stale entries
+        self._due_heap: list[tuple[dt, tuple[DeviceIdT, str]]] = []
         self._poller_task: asyncio.Task[None] | None = None
         self._running: bool = False
 
@@ -214,15 +221,18 @@ class PollingManager:
         for code, interval in schedule.items():
             key = (device.id, code)
             active_keys.add(key)
-            if key not in self._tasks:
-                self._tasks[key] = PollingTask(
+            task = self._tasks.get(key)
+            if task is None:
+                task = PollingTask(
                     device_id=device.id,
                     code=code,
                     interval=interval,
                     next_due=now + td(seconds=interval),
                 )
+                self._tasks[key] = task
+                heapq.heappush(self._due_heap, (task.next_due, key))
             else:
-                self._tasks[key].interval = interval
+                task.interval = interval
 
         return active_keys
 
@@ -239,7 +249,7 @@ class PollingManager:
         if self._running:
             return
 
-        if getattr(self._gwy.config, "disable_polling", False):
+        if getattr(self._config, "disable_polling", False):
             _LOGGER.info("PollingManager: Polling disabled by GatewayConfig.")
             return
 
@@ -266,12 +276,20 @@ class PollingManager:
         :rtype: float
         """
         if not self._tasks:
+            self._due_heap.clear()
             return self._cycle_interval
 
         now = dt.now(UTC)
-        next_due = min(task.next_due for task in self._tasks.values())
-        delay = (next_due - now).total_seconds()
-        return max(1.0, min(delay, self._cycle_interval))
+        heap = self._due_heap
+        while heap:
+            next_due, key = heap[0]
+            task = self._tasks.get(key)
+            if task is not None and task.next_due == next_due:
+                delay = (next_due - now).total_seconds()
+                return max(1.0, min(delay, self._cycle_interval))
+            heapq.heappop(heap)  # task pruned or rescheduled since pushed
+
+        return self._cycle_interval
 
     async def _poll_loop(self) -> None:
         """Evaluate and execute scheduled tasks in the background."""
@@ -290,7 +308,7 @@ class PollingManager:
         :returns: Number of tasks processed during this cycle.
         :rtype: int
         """
-        if getattr(self._gwy.config, "disable_polling", False):
+        if getattr(self._config, "disable_polling", False):
             return 0
 
         # Refresh tasks for all devices currently in registry and prune stale tasks
@@ -322,10 +340,16 @@ class PollingManager:
                 )
                 task.last_polled = now
                 task.next_due = now + td(seconds=task.interval)
+                heapq.heappush(
+                    self._due_heap, (task.next_due, (task.device_id, task.code))
+                )
             else:
                 _LOGGER.info("Polling device %s command %s", task.device_id, task.code)
                 task.last_polled = now
                 task.next_due = now + td(seconds=task.interval)
+                heapq.heappush(
+                    self._due_heap, (task.next_due, (task.device_id, task.code))
+                )
                 cmd_dto = build_rq_cmd(task.device_id, task.code)
                 try:
                     await self._gwy.async_send_cmd(cmd_dto)
@@ -3,6 +3,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from sys import intern
+from types import MappingProxyType
+from typing import Final
+
 from ramses_rf.typing import DeviceFingerprint
 
 __all__ = ["check_signature"]
@@ -102,10 +107,13 @@ __DEVICE_INFO_RAW: dict[str, DeviceFingerprint] = {
 }
 # fmt: on
 
-__DEVICE_INFO: dict[str, list[str]] = {
-    t: [k for k, v in __DEVICE_INFO_RAW.items() if v["dev_type"] == t]
-    for t in sorted(dict.fromkeys(v["dev_type"] for v in __DEVICE_INFO_RAW.values()))
-}  # convert to {dev_type: [signature, ...]}
+# Each signature implies exactly one device type, so the reverse index is a
+# plain mapping, built in one pass (signatures are unique dict keys above).
+# Interned keys/values share one object per distinct string and carry a
+# cached hash, keeping repeated probes on the dict's fast path
+_SIG_TO_TYPE: Final[Mapping[str, str]] = MappingProxyType(
+    {intern(sig): intern(info["dev_type"]) for sig, info in __DEVICE_INFO_RAW.items()}
+)
 
 
 def check_signature(dev_type: str, signature: str) -> None:
@@ -113,7 +121,7 @@ def check_signature(dev_type: str, signature: str) -> None:
 
     e.g. '01' can imply '0002FF0119FFFFFFFF', but not '0001C8820C006AFEFF'
     """
-    if not (sigs := __DEVICE_INFO.get(dev_type)) or signature not in sigs:
+    if _SIG_TO_TYPE.get(signature) != dev_type:
         raise ValueError(
             f"device type {dev_type} not known to have signature: {signature}"
         )
@@ -12,6 +12,7 @@ import asyncio
 import contextlib
 import logging
 from datetime import UTC, datetime as dt
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any, Literal, overload
 
 from ramses_rf.const import SZ_DOMAIN_ID, SZ_NAME, SZ_ZONE_IDX
@@ -23,6 +24,7 @@ from ramses_tx.typing import PayDictT
 
 from .. import exceptions as exc
 from ..messages import ApplicationMessage, Message
+from ..messages.base import _index_list_payload
 from ..protocol.ramses import CODES_SCHEMA
 from ..routing import RoutingContext, StateHeader
 
@@ -36,6 +38,12 @@ _LOGGER = logging.getLogger(__name__)
 # Constants for slicing the device ID
 _ID_SLICE = 9
 
+# Keys stripped from payloads returned by _msg_value_msg (index keys, privates)
+_EXCLUDED_KEYS = frozenset(("dhw_idx", SZ_DOMAIN_ID, SZ_ZONE_IDX))
+
+# C-level key callable for newest-message selection
+_BY_DTM = attrgetter("dtm")
+
 
 class StateCache:
     """Encapsulates the state cache data collection for an entity.
@@ -46,10 +54,17 @@ class StateCache:
     def __init__(self) -> None:
         """Initialize the StateCache."""
         self._cache: dict[StateHeader, ApplicationMessage] = {}
+        # Flat secondary index keyed by (code, verb, ctx-as-string), so the
+        # source-id-unknown fallback is one hashed lookup, not an O(N) scan
+        self._by_routing_key: dict[tuple[str, str, str], ApplicationMessage] = {}
 
     def add(self, msg: ApplicationMessage) -> None:
         """Add a message to the cache natively via its header."""
-        self._cache[msg.state_header] = msg
+        hdr = msg.state_header
+        self._cache[hdr] = msg
+        self._by_routing_key[(str(hdr.code), str(hdr.verb), hdr.context.as_string)] = (
+            msg
+        )
 
     def get_message(self, header: StateHeader) -> ApplicationMessage | None:
         """Retrieve a message directly by its StateHeader."""
@@ -58,16 +73,10 @@ class StateCache:
     def get_by_routing_key(
         self, code: Code | str, verb: VerbT | str, ctx: Any
     ) -> ApplicationMessage | None:
-        """Fallback O(N) lookup when source_id is unknown."""
-        ctx_str = RoutingContext(ctx).as_string
-        for hdr, msg in self._cache.items():
-            if (
-                hdr.code == code
-                and hdr.verb == verb
-                and hdr.context.as_string == ctx_str
-            ):
-                return msg
-        return None
+        """Fallback O(1) lookup when source_id is unknown."""
+        return self._by_routing_key.get(
+            (str(code), str(verb), RoutingContext(ctx).as_string)
+        )
 
     def get_by_code(self, code: Code | str) -> list[ApplicationMessage]:
         """Retrieve all messages for a specific code."""
@@ -130,9 +139,10 @@ class EntityState:
             self._delete_tasks.clear()
 
         # Only process NEW packets appended since the last sync
-        new_msgs = log_iterable[self._log_cursor :]
-        for msg in new_msgs:
-            self.ingest_message(msg)
+        # (bind the bound method once - the loop runs per new packet)
+        ingest = self.ingest_message
+        for msg in log_iterable[self._log_cursor :]:
+            ingest(msg)
 
         self._log_cursor = current_len
 
@@ -226,8 +236,10 @@ class EntityState:
     ) -> ApplicationMessage | None:
         """Return a msg, if any, that matches a given header."""
         if isinstance(hdr, str):
-            code_str, verb_str, src_id, *args = hdr.split("|")
-            ctx_val: str | bool | None = args[0] if args else None
+            # Bounded split: at most 4 fields, no list of trailing fragments
+            parts = hdr.split("|", 3)
+            code_str, verb_str, src_id = parts[0], parts[1], parts[2]
+            ctx_val: str | bool | None = parts[3] if len(parts) > 3 else None
             if ctx_val == "True":
                 ctx_val = True
             elif ctx_val == "False":
@@ -252,17 +264,16 @@ class EntityState:
             return None
 
         cache = await self._build_state_cache()
-        msg = cache.get_message(header)
 
-        # Fallbacks for unknown source ID routing
-        if msg is None:
-            msg = cache.get_by_routing_key(
-                header.code, header.verb, header.context.value
-            )
-        if msg is None:
-            msg = cache.get_by_routing_key(header.code, header.verb, False)
-        if msg is None:
-            msg = cache.get_by_routing_key(header.code, header.verb, None)
+        # Exact hit, then fallbacks for unknown source ID routing - each is a
+        # single hashed probe, short-circuited on first hit
+        get_fallback = cache.get_by_routing_key
+        msg = (
+            cache.get_message(header)
+            or get_fallback(header.code, header.verb, header.context.value)
+            or get_fallback(header.code, header.verb, False)
+            or get_fallback(header.code, header.verb, None)
+        )
 
         if msg is None:
             return None
@@ -401,8 +412,12 @@ class EntityState:
                 msg = None
         elif isinstance(code, tuple):
             msgs_dict = await self.get_message_log_flat()
-            msgs_list = [m for m in msgs_dict.values() if m.code in code]
-            msg = max(msgs_list, key=lambda m: m.dtm) if msgs_list else None
+            if len(code) == 1:
+                msg = msgs_dict.get(code[0])
+            else:
+                # The log is keyed by code: hit the keys, don't scan the values
+                msgs_list = [msgs_dict[c] for c in code if c in msgs_dict]
+                msg = max(msgs_list, key=_BY_DTM) if msgs_list else None
         else:
             msgs_dict = await self.get_message_log_flat()
             msg = msgs_dict.get(code)
@@ -454,11 +469,20 @@ class EntityState:
             if idx and idx != SZ_DOMAIN_ID and msg_dict.get(idx) != val:
                 return None
         elif idx:
-            msg_dict = {
-                k: v for d in payload for k, v in d.items() if d.get(idx) == val
-            }
-            if not msg_dict:
+            # List payloads are pre-indexed (and cached) on the message, so
+            # each read is one dict probe, not a rebuild of the whole list
+            by_idx: Any = (
+                msg._payload_by_domain_id
+                if idx == SZ_DOMAIN_ID
+                else msg._payload_by_zone_idx
+            )
+            # Protect against the Mock Trap during testing
+            if not isinstance(by_idx, dict):
+                by_idx = _index_list_payload(payload, idx)
+            found = by_idx.get(val)
+            if found is None:
                 return None
+            msg_dict = found
         else:
             if not payload:
                 return None
@@ -470,7 +494,7 @@ class EntityState:
             return {
                 k: v
                 for k, v in msg_dict.items()
-                if k not in ("dhw_idx", SZ_DOMAIN_ID, SZ_ZONE_IDX) and k[:1] != "_"
+                if k not in _EXCLUDED_KEYS and k[:1] != "_"
             }
         return msg_dict.get(key)
 
@@ -638,8 +662,9 @@ class EntityState:
         cache = StateCache()
 
         # Extremely fast O(1) iteration, bypassing global history!
-        for _hdr, msg in self._current_state.items():
-            cache.add(msg)
+        add = cache.add
+        for msg in self._current_state.values():
+            add(msg)
 
         return cache
 
@@ -647,14 +672,16 @@ class EntityState:
         """Get the codes seen by the entity."""
         msgs_dict = await self.get_message_log_flat()
 
-        # Build traits dictionary safely checking for valid Code enums
-        codes: dict[Code | str, str | None] = {}
-        for code in sorted(msgs_dict, key=str):
-            if msgs_dict[code].src.id == self._entity.id[:9]:
-                name = None
-                # Type-narrow to satisfy CODES_SCHEMA strict indexing requirements
-                if isinstance(code, Code) and code in CODES_SCHEMA:
-                    name = CODES_SCHEMA[code].get(SZ_NAME)
-                codes[code] = name
-
-        return {"_sent": list(codes.keys())}
+        # Build traits dictionary safely checking for valid Code enums; the
+        # owner id and schema accessor are loop-invariant, so hoist them
+        owner_id = self._entity.id[:9]
+        schema_get = CODES_SCHEMA.get
+        codes: dict[Code | str, str | None] = {
+            code: (schema_get(code) or {}).get(SZ_NAME)
+            if isinstance(code, Code)
+            else None
+            for code, msg in sorted(msgs_dict.items(), key=lambda kv: str(kv[0]))
+            if msg.src.id == owner_id
+        }
+
+        return {"_sent": list(codes)}
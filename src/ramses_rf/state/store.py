@@ -112,6 +112,9 @@ class MessageStore(MessageStoreInterface):
         self._message_log: MsgDdT = OrderedDict()
         # Caches the latest message per strictly-typed StateHeader.
         self._state_cache: dict[StateHeader, Message] = {}
+        # Secondary index: code -> dtm keys, so code-filtered queries need
+        # only scan the (usually small) slice of the log with that code.
+        self._code_index: dict[str, set[DtmStrT]] = {}
 
         # Synchronous Test Mode: Bypass background worker entirely if testing
         self._is_testing = "PYTEST_CURRENT_TEST" in os.environ
@@ -147,6 +150,7 @@ class MessageStore(MessageStoreInterface):
                 uri=True,  # Enable URI parsing for shared memory support
                 timeout=10.0,  # Increased timeout to reduce 'database locked' errors
                 isolation_level=None,  # Autocommit mode prevents stale snapshots
+                cached_statements=256,  # The delete SQL varies by kwarg shape
             )
 
             # Enable Write-Ahead Logging for Reader as well
@@ -230,6 +234,15 @@ class MessageStore(MessageStoreInterface):
         """Return the latest messages in the index natively keyed by StateHeader."""
         return self._state_cache
 
+    def _code_index_add(self, dtm_str: DtmStrT, msg: Message) -> None:
+        """Register a message's dtm key under its code."""
+        self._code_index.setdefault(str(msg.code), set()).add(dtm_str)
+
+    def _code_index_discard(self, dtm_str: DtmStrT, msg: Message) -> None:
+        """Remove a message's dtm key from its code's entry."""
+        if (hits := self._code_index.get(str(msg.code))) is not None:
+            hits.discard(dtm_str)
+
     def flush(self) -> None:
         """Flush the storage worker queue.
 
@@ -330,6 +343,7 @@ class MessageStore(MessageStoreInterface):
 
                     self._message_log[dtm_str] = msg
                     self._state_cache[msg.state_header] = msg
+                    self._code_index_add(dtm_str, msg)
                 except Exception as err:
                     _LOGGER.debug("Failed to reconstruct message for %s: %s", hdr, err)
         finally:
@@ -367,6 +381,11 @@ class MessageStore(MessageStoreInterface):
                     (k, v) for k, v in self._message_log.items() if k >= dtm_iso
                 )
 
+                code_index: dict[str, set[DtmStrT]] = {}
+                for k, v in self._message_log.items():
+                    code_index.setdefault(str(v.code), set()).add(k)
+                self._code_index = code_index
+
                 valid_dtms = set(self._message_log.keys())
                 self._state_cache = {
                     m.state_header: m
@@ -413,8 +432,11 @@ class MessageStore(MessageStoreInterface):
         except sqlite3.Error:
             pass
         else:
+            if dup:
+                self._code_index_discard(dtm_str, dup[0])
             self._message_log[dtm_str] = msg
             self._state_cache[msg.state_header] = msg
+            self._code_index_add(dtm_str, msg)
         finally:
             pass
 
@@ -470,6 +492,7 @@ class MessageStore(MessageStoreInterface):
         )
         self._message_log[dtm] = msg
         self._state_cache[msg.state_header] = msg
+        self._code_index_add(dtm, msg)
 
     def _insert_into(self, msg: Message) -> Message | None:
         """
@@ -572,6 +595,7 @@ class MessageStore(MessageStoreInterface):
                     dtm_val = DtmStrT(m.dtm.isoformat(timespec="microseconds"))
                     self._message_log.pop(dtm_val, None)
                     self._state_cache.pop(m.state_header, None)
+                    self._code_index_discard(dtm_val, m)
         return msgs
 
     async def get(
@@ -609,6 +633,13 @@ class MessageStore(MessageStoreInterface):
         if msg:
             kwargs["dtm"] = msg.dtm
 
+        # Fast path: the log is keyed by dtm, so a dtm-only query (the common
+        # case, via rem(msg)) is a single hashed lookup, not a linear scan
+        if len(kwargs) == 1 and isinstance(dtm_val := kwargs.get("dtm"), dt):
+            key = DtmStrT(dtm_val.isoformat(timespec="microseconds"))
+            hit = self._message_log.get(key)
+            return (hit,) if hit is not None else ()
+
         if "ctx" in kwargs:
             c_val = kwargs["ctx"]
             if isinstance(c_val, str):
@@ -618,8 +649,20 @@ class MessageStore(MessageStoreInterface):
             else:
                 kwargs["ctx"] = "False"
 
+        # Narrow the scan via the code index - most codes account for a small
+        # slice of the log (the dtm keys sort chronologically, like the log)
+        if (code_val := kwargs.get("code")) is not None:
+            hits = self._code_index.get(str(code_val))
+            if not hits:
+                return ()
+            candidates = tuple(
+                m for k in sorted(hits) if (m := self._message_log.get(k)) is not None
+            )
+        else:
+            candidates = self.log_by_dtm
+
         res: list[Message] = []
-        for m in self.log_by_dtm:
+        for m in candidates:
             match = True
             for k, v in kwargs.items():
                 if k == "dtm" and m.dtm != v:
@@ -668,6 +711,11 @@ class MessageStore(MessageStoreInterface):
     ) -> bool:
         """Check if the MessageStore contains at least 1 record that
         matches the provided fields."""
+        # O(1) fast path: a code-only probe (the common case) just needs the
+        # code index to hold at least one live dtm key
+        if code is not None and all(v is None for v in (dtm, src, dst, verb, ctx, hdr)):
+            return bool(self._code_index.get(str(code)))
+
         return (
             len(
                 await self.get(
@@ -722,3 +770,4 @@ class MessageStore(MessageStoreInterface):
 
         self._message_log.clear()
         self._state_cache.clear()
+        self._code_index.clear()
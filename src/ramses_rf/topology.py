@@ -24,7 +24,7 @@ entities, such as the association between a Zone and its Actuators.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Final, Protocol, runtime_checkable
 
 from ramses_tx.const import F9, FA, FC, FF
 
@@ -58,6 +58,33 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 _TRACE = logging.getLogger("ramses_rf.legacy_trace")
 
+# All heating zone classes share the same actuator/sensor constraints
+_ZONE_RULES: Final[dict[str, tuple[str, ...]]] = {
+    SZ_ACTUATORS: ("BdrSwitch", "TrvActuator", "UfhCircuit"),
+    SZ_SENSOR: ("Controller", "Thermostat", "TrvActuator"),
+}
+
+# Allowed child classes per parent class, keyed by class name (the concrete
+# classes live in modules that import this one, so names avoid a cycle)
+_PARENT_RULES: Final[dict[str, dict[str, tuple[str, ...]]]] = {
+    "DhwZone": {SZ_ACTUATORS: ("BdrSwitch",), SZ_SENSOR: ("DhwSensor",)},
+    "System": {
+        SZ_ACTUATORS: ("BdrSwitch", "OtbGateway", "UfhController"),
+        SZ_SENSOR: ("OutSensor",),
+    },
+    "Evohome": {
+        SZ_ACTUATORS: ("BdrSwitch", "OtbGateway", "UfhController"),
+        SZ_SENSOR: ("OutSensor",),
+    },
+    "UfhController": {SZ_ACTUATORS: ("UfhCircuit",), SZ_SENSOR: ()},
+    "Zone": _ZONE_RULES,
+    "EleZone": _ZONE_RULES,
+    "MixZone": _ZONE_RULES,
+    "RadZone": _ZONE_RULES,
+    "UfhZone": _ZONE_RULES,
+    "ValZone": _ZONE_RULES,
+}
+
 
 class Parent:
     """A Parent can be a System (TCS), a heating Zone, or a UFH Controller.
@@ -380,44 +407,7 @@ class Child:
                 _TRACE.error("PARENT CHANGE EXCEPTION: %s", err_msg)
                 raise exc.SystemSchemaInconsistent(err_msg)
 
-        PARENT_RULES: dict[str, dict[str, tuple[str, ...]]] = {
-            "DhwZone": {SZ_ACTUATORS: ("BdrSwitch",), SZ_SENSOR: ("DhwSensor",)},
-            "System": {
-                SZ_ACTUATORS: ("BdrSwitch", "OtbGateway", "UfhController"),
-                SZ_SENSOR: ("OutSensor",),
-            },
-            "Evohome": {
-                SZ_ACTUATORS: ("BdrSwitch", "OtbGateway", "UfhController"),
-                SZ_SENSOR: ("OutSensor",),
-            },
-            "UfhController": {SZ_ACTUATORS: ("UfhCircuit",), SZ_SENSOR: ()},
-            "Zone": {
-                SZ_ACTUATORS: ("BdrSwitch", "TrvActuator", "UfhCircuit"),
-                SZ_SENSOR: ("Controller", "Thermostat", "TrvActuator"),
-            },
-            "EleZone": {
-                SZ_ACTUATORS: ("BdrSwitch", "TrvActuator", "UfhCircuit"),
-                SZ_SENSOR: ("Controller", "Thermostat", "TrvActuator"),
-            },
-            "MixZone": {
-                SZ_ACTUATORS: ("BdrSwitch", "TrvActuator", "UfhCircuit"),
-                SZ_SENSOR: ("Controller", "Thermostat", "TrvActuator"),
-            },
-            "RadZone": {
-                SZ_ACTUATORS: ("BdrSwitch", "TrvActuator", "UfhCircuit"),
-                SZ_SENSOR: ("Controller", "Thermostat", "TrvActuator"),
-            },
-            "UfhZone": {
-                SZ_ACTUATORS: ("BdrSwitch", "TrvActuator", "UfhCircuit"),
-                SZ_SENSOR: ("Controller", "Thermostat", "TrvActuator"),
-            },
-            "ValZone": {
-                SZ_ACTUATORS: ("BdrSwitch", "TrvActuator", "UfhCircuit"),
-                SZ_SENSOR: ("Controller", "Thermostat", "TrvActuator"),
-            },
-        }
-
-        rules = PARENT_RULES.get(parent_class)
+        rules = _PARENT_RULES.get(parent_class)
         if not rules:
             _TRACE.error("PARENT RULES EXCEPTION: %s is not a valid parent.", parent)
             raise exc.SchemaInconsistentError(
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from sys import intern
 from typing import Final
 
 from . import exceptions as exc
@@ -36,8 +37,10 @@ class Address:
         :raises ValueError: If the device_id is not a valid format.
         """
 
-        self.id = device_id
-        self.type = device_id[:2]  # dex, drops 2nd part, incl. ":"
+        # A gateway sees the same few dozen ids constantly: interning makes
+        # every id comparison start with a pointer-equality hit
+        self.id: DeviceIdT = DeviceIdT(intern(device_id))
+        self.type = intern(device_id[:2])  # dex, drops 2nd part, incl. ":"
         self._hex_id: str = None  # type: ignore[assignment]
 
         if not self.is_valid(device_id):
@@ -339,12 +339,13 @@ DOMAIN_TYPE_MAP: dict[str, str] = {
 # DTM_TIME_REGEX = re.compile(r"[0-2]\d:[0-5]\d:[0-5]\d\.\d{3} ?")  # 13:15:00.123  # obsolete?
 
 # Used by Packet.from_raw_line to validate unparsed ASCII line structures
-r = r"(-{3}|\d{3}|\.{3})"  # RSSI, '...' was used by an older version of evofw3
-v = r"( I|RP|RQ| W)"  # verb
-d = r"(-{2}:-{6}|\d{2}:\d{6})"  # device ID
+# (non-capturing groups: the match is used only as a structure check)
+r = r"(?:-{3}|\d{3}|\.{3})"  # RSSI, '...' was used by an older version of evofw3
+v = r"(?: I|RP|RQ| W)"  # verb
+d = r"(?:-{2}:-{6}|\d{2}:\d{6})"  # device ID
 c = r"[0-9A-F]{4}"  # code
 l = r"\d{3}"  # length # noqa: E741
-p = r"([0-9A-F]{2}){1,48}"  # payload
+p = r"(?:[0-9A-F]{2}){1,48}"  # payload
 
 RAW_LINE_REGEX = re.compile(f"^{v} {r} {d} {d} {d} {c} {l} {p}$")
 COMMAND_REGEX = RAW_LINE_REGEX  # Backward-compatibility alias
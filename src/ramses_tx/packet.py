@@ -14,7 +14,7 @@ from typing import Any
 import orjson
 
 from . import exceptions as exc
-from .address import ALL_DEV_ADDR, NON_DEV_ADDR, Address, pkt_addrs
+from .address import ALL_DEV_ADDR, HGI_DEVICE_ID, NON_DEV_ADDR, Address, pkt_addrs
 from .const import I_, RAW_LINE_REGEX, RP, W_, Code, VerbT
 from .dtos import CommandDTO, PacketDTO
 from .logger import getLogger
@@ -48,6 +48,7 @@ class Packet:
         "_raw_line",
         "_ctx_",
         "_hdr_",
+        "_has_hgi_",
         "_idx_",
         "_repr",
         "_lifespan",
@@ -71,6 +72,7 @@ class Packet:
 
     _ctx_: str | bool | None
     _hdr_: HeaderT | None
+    _has_hgi_: bool | None
     _idx_: str | bool | None
     _repr: str | None
     _lifespan: bool | td
@@ -133,6 +135,7 @@ class Packet:
             self._raw_line = getattr(constructed, "_raw_line", None)
             self._ctx_ = None
             self._hdr_ = None
+            self._has_hgi_ = None
             self._idx_ = None
             self._repr = None
             self._lifespan = False
@@ -169,6 +172,7 @@ class Packet:
 
         self._ctx_ = None
         self._hdr_ = None
+        self._has_hgi_ = None
         self._idx_ = None
         self._repr = None
         self._lifespan = False
@@ -232,7 +236,7 @@ class Packet:
                 f"Bad frame: Invalid structure: >>>{raw_line_body}<<<"
             )
 
-        fields = raw_line_body.lstrip().split(" ")
+        fields = raw_line_body.lstrip().split(" ", 7)
         if len(fields) < 8:
             raise exc.PacketInvalid(
                 f"Bad frame: Insufficient fields: >>>{raw_line_body}<<<"
@@ -299,6 +303,7 @@ class Packet:
 
         pkt._ctx_ = None
         pkt._hdr_ = None
+        pkt._has_hgi_ = None
         pkt._idx_ = None
         pkt._repr = None
         pkt._lifespan = False
@@ -608,6 +613,17 @@ class Packet:
         self._hdr_ = res if res is not None else HeaderT(f"{self.code}|{self.verb}")
         return self._hdr_
 
+    @property
+    def _has_hgi(self) -> bool:
+        """Return True if the header contains the sentinel HGI device id.
+
+        :returns: Whether the (lazily cached) header names the sentinel id
+        :rtype: bool
+        """
+        if self._has_hgi_ is None:
+            self._has_hgi_ = HGI_DEVICE_ID in self._hdr
+        return self._has_hgi_
+
     @staticmethod
     def _partition(raw_line: str) -> tuple[str, str, str]:
         """Partition a raw packet line into line body, error text, and comment.
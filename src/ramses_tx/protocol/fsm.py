@@ -90,7 +90,7 @@ class ProtocolContext(StateMachineInterface):
             max_buffer_size=max_buffer_size,
         )
 
-        self._expiry_timer: asyncio.Task[None] | None = None
+        self._expiry_timer: asyncio.TimerHandle | None = None
         self._state: _ProtocolStateT = None  # type: ignore[assignment]
 
         self._send_fnc: Callable[[CommandDTO], Coroutine[Any, Any, None]] = None  # type: ignore[assignment]
@@ -145,13 +145,64 @@ class ProtocolContext(StateMachineInterface):
     @property
     def is_sending(self) -> bool:
         """Return True if the context is currently sending a command."""
-        return isinstance(self._state, WantEcho)
+        return type(self._state) is WantEcho
 
     @property
     def state(self) -> _ProtocolStateT:
         """Return the current state of the FSM."""
         return self._state
 
+    def _schedule(self, callback: Callable[..., None], *args: Any) -> None:
+        """Schedule a callback on the loop, cheaply when already on-loop.
+
+        call_soon_threadsafe wakes the loop's selector via a self-pipe write;
+        that syscall is wasted when the caller is already the loop thread (the
+        common case: protocol callbacks and send coroutines), so only pay it
+        for genuine cross-thread calls.
+
+        :param callback: The callback to schedule.
+        :type callback: Callable[..., None]
+        :param args: Positional arguments for the callback.
+        :type args: Any
+        """
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is self._loop:
+            self._loop.call_soon(callback, *args)
+        else:
+            self._loop.call_soon_threadsafe(callback, *args)
+
+    def _expire_state(self, delay: float, old_val: int) -> None:
+        """Handle expiry of the active state's timeout (runs via call_later).
+
+        :param delay: The delay that has just elapsed (for logging).
+        :type delay: float
+        :param old_val: The multiplier value to restore and increment.
+        :type old_val: int
+        """
+        self._expiry_timer = None
+        self._qos_mgr.restore_multiplier(old_val)
+
+        level = (
+            logging.DEBUG
+            if self._qos_mgr.tx_count < 3
+            else logging.INFO
+            if self._qos_mgr.tx_count == 3
+            else logging.WARNING
+        )
+        _LOGGER.log(
+            level,
+            f"Timeout expired waiting for echo: {self} (delay={delay})",
+        )
+
+        if self._qos_mgr.tx_count < self._qos_mgr.tx_limit:
+            self.set_state(WantEcho, timed_out=True)
+        else:
+            self.set_state(IsInIdle, expired=True)
+
     def set_state(
         self,
         state_class: _ProtocolStateClassT,
@@ -174,41 +225,24 @@ class ProtocolContext(StateMachineInterface):
         :type result: Packet | None
         """
 
-        async def expire_state_on_timeout() -> None:
-            delay, old_val = self._qos_mgr.get_and_update_delay(
-                isinstance(self._state, WantEcho)
-            )
-            await asyncio.sleep(delay)
-            self._qos_mgr.restore_multiplier(old_val)
-
-            level = (
-                logging.DEBUG
-                if self._qos_mgr.tx_count < 3
-                else logging.INFO
-                if self._qos_mgr.tx_count == 3
-                else logging.WARNING
-            )
-            _LOGGER.log(
-                level,
-                f"Timeout expired waiting for echo: {self} (delay={delay})",
-            )
-
-            if self._qos_mgr.tx_count < self._qos_mgr.tx_limit:
-                self.set_state(WantEcho, timed_out=True)
-            else:
-                self.set_state(IsInIdle, expired=True)
-
         def effect_state(timed_out: bool) -> None:
             if timed_out and self._qos_mgr.cmd is not None:
                 self._send_cmd(self._qos_mgr.cmd, is_retry=True)
 
-            if isinstance(self._state, IsInIdle):
-                self._loop.call_soon_threadsafe(self._check_buffer_for_cmd)
-            elif isinstance(self._state, WantEcho):
-                self._expiry_timer = self._loop.create_task(expire_state_on_timeout())
+            if type(self._state) is IsInIdle:
+                self._schedule(self._check_buffer_for_cmd)
+            elif type(self._state) is WantEcho:
+                # A plain timer handle, not a Task: a sleeping coroutine costs
+                # a Task object per WantEcho transition just to wait
+                delay, old_val = self._qos_mgr.get_and_update_delay(
+                    type(self._state) is WantEcho
+                )
+                self._expiry_timer = self._loop.call_later(
+                    delay, self._expire_state, delay, old_val
+                )
 
         if self._expiry_timer is not None:
-            self._expiry_timer.cancel("Changing state")
+            self._expiry_timer.cancel()
             self._expiry_timer = None
 
         current_state_name = self._state.__class__.__name__
@@ -217,15 +251,21 @@ class ProtocolContext(StateMachineInterface):
 
         if self._qos_mgr.fut is None:
             _LOGGER.debug(
-                f"FSM state changed {transition}: no active future (ctx={self})"
+                "FSM state changed %s: no active future (ctx=%s)", transition, self
             )
-        elif self._qos_mgr.fut.cancelled() and not isinstance(self._state, IsInIdle):
+        elif self._qos_mgr.fut.cancelled() and type(self._state) is not IsInIdle:
             _LOGGER.debug(
-                f"FSM state changed {transition}: future cancelled (expired={expired}, ctx={self})"
+                "FSM state changed %s: future cancelled (expired=%s, ctx=%s)",
+                transition,
+                expired,
+                self,
             )
         elif exception:
             _LOGGER.debug(
-                f"FSM state changed {transition}: exception occurred (error={exception}, ctx={self})"
+                "FSM state changed %s: exception occurred (error=%s, ctx=%s)",
+                transition,
+                exception,
+                self,
             )
             if not self._qos_mgr.fut.done():
                 self._qos_mgr.fut.set_exception(exception)
@@ -257,12 +297,12 @@ class ProtocolContext(StateMachineInterface):
 
         if timed_out:
             self._qos_mgr.tx_count += 1
-        elif isinstance(self._state, WantEcho):
+        elif type(self._state) is WantEcho:
             self._qos_mgr.tx_count = 1
         else:
             self._qos_mgr.reset_active()
 
-        self._loop.call_soon_threadsafe(effect_state, timed_out)
+        self._schedule(effect_state, timed_out)
 
     def connection_made(self, transport: TransportInterface) -> None:
         """Handle the transport connection being made."""
@@ -315,13 +355,13 @@ class ProtocolContext(StateMachineInterface):
         """
         self._send_fnc = send_fnc
 
-        if isinstance(self._state, Inactive):
+        if type(self._state) is Inactive:
             raise ProtocolSendFailed(f"{self}: Send failed (no active transport?)")
 
         fut = self._qos_mgr.enqueue(priority, cmd, qos)
 
-        if isinstance(self._state, IsInIdle):
-            self._loop.call_soon_threadsafe(self._check_buffer_for_cmd)
+        if type(self._state) is IsInIdle:
+            self._schedule(self._check_buffer_for_cmd)
 
         timeout = min(qos.timeout, self.SEND_TIMEOUT_LIMIT)
         try:
@@ -353,11 +393,9 @@ class ProtocolContext(StateMachineInterface):
         if not self._qos_mgr.get_next():
             return
 
-        try:
-            assert self._qos_mgr.cmd is not None
-            self._send_cmd(self._qos_mgr.cmd)
-        finally:
-            self._qos_mgr.task_done()
+        cmd = self._qos_mgr.cmd
+        assert cmd is not None  # mypy hint: get_next() returned True
+        self._send_cmd(cmd)
 
     def _send_cmd(self, cmd: CommandDTO, is_retry: bool = False) -> None:
         """Wrapper to send a command with retries, until success or exception.
@@ -416,6 +454,10 @@ class ProtocolContext(StateMachineInterface):
 class ProtocolStateBase:
     """The base class for the protocol finite state machine states."""
 
+    # One state object is allocated per transition, so keep them slotted
+    # (_prev_state is only set when _DBG_MAINTAIN_STATE_CHAIN is enabled)
+    __slots__ = ("_context", "_sent_cmd", "_echo_pkt", "_rply_pkt", "_prev_state")
+
     def __init__(self, context: ProtocolContext) -> None:
         """Initialize the state with the protocol context."""
         self._context = context
@@ -440,10 +482,10 @@ class ProtocolStateBase:
 
     def connection_lost(self) -> None:
         """Transition to Inactive, regardless of current state."""
-        if isinstance(self._context._state, Inactive):
+        if type(self._context._state) is Inactive:
             return
 
-        if isinstance(self._context._state, IsInIdle):
+        if type(self._context._state) is IsInIdle:
             self._context.set_state(Inactive)
             return
 
@@ -469,6 +511,8 @@ class ProtocolStateBase:
 class Inactive(ProtocolStateBase):
     """The Protocol is not connected to the transport layer."""
 
+    __slots__ = ()
+
     def connection_made(self) -> None:
         """Transition to IsInIdle."""
         self._context.set_state(IsInIdle)
@@ -482,6 +526,8 @@ class Inactive(ProtocolStateBase):
 class IsInIdle(ProtocolStateBase):
     """The Protocol is not in the process of sending a CommandDTO."""
 
+    __slots__ = ()
+
     def pkt_rcvd(self, pkt: Packet) -> None:
         """Do nothing as we're not expecting an echo, nor a reply."""
         pass
@@ -505,10 +551,17 @@ class IsInIdle(ProtocolStateBase):
 class WantEcho(ProtocolStateBase):
     """The Protocol is waiting to receive an echo Packet."""
 
+    __slots__ = ("_expected_hdr",)
+
     def __init__(self, context: ProtocolContext) -> None:
         """Initialize the state from the previous context state."""
         super().__init__(context)
         self._sent_cmd = context._state._sent_cmd
+        # The expected echo header is fixed for this state's lifetime, so
+        # compute it once rather than per received packet
+        self._expected_hdr: HeaderT | None = (
+            HeaderT(self._sent_cmd.tx_header) if self._sent_cmd is not None else None
+        )
 
     def pkt_rcvd(self, pkt: Packet) -> None:
         """If the pkt is the expected Echo, transition to IsInIdle."""
@@ -525,15 +578,14 @@ class WantEcho(ProtocolStateBase):
         except PacketPayloadInvalid:
             return  # malformed packet, ignore
 
-        if HGI_DEVICE_ID in pkt_hdr:
+        # Only normalize the sentinel gateway id if the cheap compare fails
+        if pkt_hdr != self._expected_hdr and pkt._has_hgi:
             assert pkt._hdr_ is not None
-            pkt__hdr = HeaderT(
+            pkt_hdr = HeaderT(
                 pkt._hdr_.replace(HGI_DEVICE_ID, self._context._protocol.hgi_id)
             )
-        else:
-            pkt__hdr = pkt_hdr
 
-        if pkt__hdr != self._sent_cmd.tx_header:
+        if pkt_hdr != self._expected_hdr:
             return
 
         self._echo_pkt = pkt
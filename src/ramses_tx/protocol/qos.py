@@ -10,7 +10,9 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import dataclass
-from datetime import datetime as dt, timedelta as td
+from datetime import timedelta as td
+from heapq import heapify, heappop, heappush
+from itertools import count
 from typing import TYPE_CHECKING, Any, ClassVar, TypeAlias
 
 from ..const import (
@@ -32,7 +34,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 _FutureT: TypeAlias = asyncio.Future[Packet]
-_QueueEntryT: TypeAlias = tuple[Priority, dt, CommandDTO, QosParams, _FutureT]
+_QueueEntryT: TypeAlias = tuple[Priority, int, CommandDTO, QosParams, _FutureT]
 
 
 class QosManager:
@@ -68,9 +70,10 @@ class QosManager:
         self.max_retry_limit = min(max_retry_limit, MAX_RETRY_LIMIT)
         self.max_buffer_size = min(max_buffer_size, DEFAULT_BUFFER_SIZE)
 
-        self._que: asyncio.PriorityQueue[_QueueEntryT] = asyncio.PriorityQueue(
-            maxsize=self.max_buffer_size
-        )
+        # All access is from the loop thread via *_nowait-style calls, so a
+        # bare heap beats a Queue; the counter preserves FIFO within priority
+        self._que: list[_QueueEntryT] = []
+        self._seq = count()
 
         self._multiplier: int = 0
         self.cmd: CommandDTO | None = None
@@ -87,7 +90,7 @@ class QosManager:
     @property
     def qsize(self) -> int:
         """Return the number of commands currently in the queue."""
-        return self._que.qsize()
+        return len(self._que)
 
     def enqueue(self, priority: Priority, cmd: CommandDTO, qos: QosParams) -> _FutureT:
         """Add a command to the queue and return its future.
@@ -103,11 +106,10 @@ class QosManager:
         :raises ProtocolSendFailed: If the send buffer is full.
         """
         fut: _FutureT = self._loop.create_future()
-        try:
-            self._que.put_nowait((priority, dt.now(), cmd, qos, fut))
-        except asyncio.QueueFull as err:
+        if len(self._que) >= self.max_buffer_size:
             fut.cancel("Send buffer overflow")
-            raise ProtocolSendFailed("Send buffer overflow") from err
+            raise ProtocolSendFailed("Send buffer overflow")
+        heappush(self._que, (priority, next(self._seq), cmd, qos, fut))
         return fut
 
     def get_next(self) -> bool:
@@ -119,28 +121,25 @@ class QosManager:
         if self.fut is not None and not self.fut.done():
             return False
 
-        while True:
-            try:
-                *_, self.cmd, self.qos, self.fut = self._que.get_nowait()
-            except asyncio.QueueEmpty:
-                self.reset_active()
-                return False
+        que = self._que
+        if que and que[0][-1].done():
+            # Catch-up after a stall: drop all finished entries in one O(N)
+            # pass rather than popping them one at a time (O(N log N))
+            que = self._que = [entry for entry in que if not entry[-1].done()]
+            heapify(que)
 
-            assert self.qos is not None
-            self.tx_count = 0
-            self.tx_limit = min(self.qos.max_retries, self.max_retry_limit) + 1
+        try:
+            *_, self.cmd, self.qos, self.fut = heappop(que)
+        except IndexError:
+            self.reset_active()
+            return False
 
-            if self.fut is not None and self.fut.done():
-                self._que.task_done()
-                continue
-            break
+        assert self.qos is not None
+        self.tx_count = 0
+        self.tx_limit = min(self.qos.max_retries, self.max_retry_limit) + 1
 
         return True
 
-    def task_done(self) -> None:
-        """Mark the active queued task as done."""
-        self._que.task_done()
-
     def reset_active(self) -> None:
         """Reset the currently active command state."""
         self.cmd = self.qos = self.fut = None
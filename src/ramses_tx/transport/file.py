@@ -6,8 +6,9 @@ from __future__ import annotations
 import asyncio
 import functools
 import logging
+from collections.abc import Awaitable, Callable
 from io import TextIOWrapper
-from typing import Any
+from typing import Any, Final
 
 import aiofiles  # type: ignore[import-untyped]
 
@@ -18,6 +19,9 @@ from .base import TransportConfig, _ReadTransport
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bounds replay memory usage: packet logs can run to hundreds of MB
+_READ_CHUNK_SIZE: Final[int] = 1 << 20  # 1 MiB
+
 
 class _FileTransportAbstractor:
     """Do the bare minimum to abstract a transport from its underlying class."""
@@ -106,26 +110,47 @@ class FileTransport(_ReadTransport, _FileTransportAbstractor):
             try:
                 # Removed redundant mode="r" to satisfy Ruff UP015
                 async with aiofiles.open(self._pkt_source, encoding="utf-8") as file:
-                    async for dtm_pkt_line in file:
-                        await self._process_line_from_raw(dtm_pkt_line)
+                    await self._process_chunks(file.read)
             except FileNotFoundError as err:
                 _LOGGER.warning("Correct the packet file name; %s", err)
 
         elif isinstance(self._pkt_source, TextIOWrapper):
-            # Wrap the synchronous TextIOWrapper for asynchronous iteration
-            async_file = aiofiles.wrap(self._pkt_source)
-            async for dtm_pkt_line in async_file:
-                await self._process_line_from_raw(dtm_pkt_line)
+            fp = self._pkt_source
+            await self._process_chunks(lambda n: asyncio.to_thread(fp.read, n))
 
         else:
             raise TransportSourceInvalid(
                 f"Packet source is not dict, TextIOWrapper or str: {self._pkt_source!r}"
             )
 
-    async def _process_line_from_raw(self, line: str) -> None:
-        """Helper to process raw lines."""
-        if (line := line.strip()) and line[:1] != "#":
-            await self._process_line(line[:26], line[27:])
+    async def _process_chunks(self, read: Callable[[int], Awaitable[str]]) -> None:
+        """Read the packet log in fixed-size chunks and process each in turn.
+
+        Reading line-by-line through aiofiles costs an executor hop per
+        frame, but reading the whole log up front costs its full size in
+        RAM: chunking bounds memory at ~_READ_CHUNK_SIZE whilst keeping the
+        hop count to one per chunk.
+        """
+        buffer = ""
+        while chunk := await read(_READ_CHUNK_SIZE):
+            lines = (buffer + chunk).split("\n")
+            buffer = lines.pop()  # may be a partial line: prepend to next chunk
+            await self._process_lines(lines)
+        if buffer:
+            await self._process_lines([buffer])
+
+    async def _process_lines(self, lines: list[str]) -> None:
+        """Push raw log lines to the protocol, one per loop iteration.
+
+        The per-frame sleep(0) paces playback so each pipeline stage task
+        downstream can consume in step, and connection_lost fires with the
+        pipeline (almost) drained.
+        """
+        for line in lines:
+            if (line := line.strip()) and line[:1] != "#":
+                await self._evt_reading.wait()
+                self._frame_read(line[:26], line[27:])
+                await asyncio.sleep(0)
 
     async def _process_line(self, dtm_str: str, frame: str) -> None:
         """Push frame to protocol in a thread-safe way."""
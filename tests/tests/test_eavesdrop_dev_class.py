@@ -3,6 +3,7 @@
 
 import asyncio
 import json
+from ast import literal_eval
 from pathlib import Path, PurePath
 
 import pytest
@@ -46,7 +47,8 @@ async def test_packets_from_log_file(dir_name: Path) -> None:
     """Check eavesdropping of a src device _SLUG (from each packet line)."""
 
     def proc_log_line(msg: Message) -> None:
-        assert msg.src._SLUG in eval(msg._dto.comment)
+        # The comment is a tuple literal, e.g. ("REM", "HVC") - no need to eval
+        assert msg.src._SLUG in literal_eval(msg._dto.comment)
 
     path = f"{dir_name}/packet.log"
 